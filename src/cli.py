@@ -2,7 +2,7 @@ import os
 import click
 from rich.prompt import Prompt, IntPrompt
 from . import subjects
-from .views import ListColumns, QuestionEntry, DisplayQuestion, CheckAnswer, ProgressChart, QuestionAnswer, AttachmentViewer, QuizSummary, PassageView
+from .views import ListColumns, QuestionEntry, DisplayQuestion, CheckAnswer, ProgressChart, QuestionAnswer, AttachmentViewer, QuizSummary
 from . import subjects
 from .models import Question, QuizSession
 from .storage import ProgressFile, Attachment
@@ -79,11 +79,8 @@ def quiz(subject_name: str, length: int):
         while not qs.is_finished():
             c = qs.current
             cq = qs.prepare_question()
-            if cq.passage is not None:
-                pv = PassageView(cq.passage)
-                pv.printPassage()
             cs = cq.prepare_selections()
-            dq = DisplayQuestion(subject.name, cq.text, cs, c)
+            dq = DisplayQuestion(subject.name, cq.text, cs, c, cq.passage)
             dq.printQuestion()
             if cq.attachment is not None:
                 attachment = Attachment(cq)
@@ -5,7 +5,9 @@ import webbrowser
 from pathlib import Path
 from urllib.parse import urljoin
 from urllib.request import pathname2url
+from rich.console import Group, RenderableType
 from rich.rule import Rule
+from rich.segment import SegmentLines
 from rich.columns import Columns
 from rich.panel import Panel
 from rich.table import Table
@@ -23,56 +25,81 @@ class RuleDisplay:
         self.title = title
         self.text = text
     
+    def render(self) -> RenderableType:
+        return Group(Rule(title=self.title), self.text)
+
     def printRule(self):
-        rule = Rule(title=self.title)
-        console.print(rule)
-        console.print(self.text)
+        console.print(self.render())
 
 class ListColumns:
     def __init__(self, contents: List[str]):
         self.contents = contents
         self.columns = Columns(contents, equal=True, expand=True)
 
+    def render(self) -> RenderableType:
+        return self.columns
+
     def printList(self):
-        console.print(self.columns)
+        lines = console.render_lines(self.render(), console.options, pad=False)
+        rendered = SegmentLines(lines, new_lines=True)
+        if not console.is_terminal or len(lines) < console.height:
+            console.print(rendered)
+            return
+        with console.pager():
+            console.print(rendered)
 
 class QuestionEntry:
     def __init__(self, question: Question, subject_name: str):
         self.question = question
         self.subject_name = subject_name.capitalize()
     
-    def printEntry(self):
-        srule = Rule(title=self.subject_name)
-        console.print(srule)
-        RuleDisplay("Question", self.question.text).printRule()
-        RuleDisplay("Choices", "\n".join([f"- {c}" for c in self.question.choices])).printRule()
-        RuleDisplay("Answer", self.question.answer).printRule()
+    def render(self) -> RenderableType:
+        parts = [
+            Rule(title=self.subject_name),
+            RuleDisplay("Question", self.question.text).render(),
+            RuleDisplay("Choices", "\n".join([f"- {c}" for c in self.question.choices])).render(),
+            RuleDisplay("Answer", self.question.answer).render(),
+        ]
         if self.question.attachment is not None:
-            panel = Panel(f"[italic]{self.question.attachment}.pdf[/italic]")
-            console.print(panel)
+            parts.append(Panel(f"[italic]{self.question.attachment}.pdf[/italic]"))
+        return Group(*parts)
+
+    def printEntry(self):
+        console.print(self.render())
 
 class PassageView:
     def __init__(self, passage: str):
         self.passage = passage
     
+    def render(self) -> RenderableType:
+        return Panel(self.passage)
+
     def printPassage(self):
-        panel = Panel(self.passage)
-        console.print(panel)
+        console.print(self.render())
 
 class DisplayQuestion:
-    def __init__(self, subject_name: str, question_text: str, selections: List[tuple[str]], number: int):
+    def __init__(self, subject_name: str, question_text: str, selections: List[tuple[str]], number: int, passage: str = None):
         self.subject_name = subject_name
         self.question_text = question_text
         self.selections = selections
         self.number = number
+        self.passage = passage
 
-    def printQuestion(self):
-        RuleDisplay(f"{self.subject_name} Question {self.number}", self.question_text).printRule()
+    def render(self) -> RenderableType:
         hr = Rule()
-        console.print(hr)
-        for s in self.selections:
-            console.print(f"{s[0]}. {s[1]}")
-        console.print(hr)
+        parts = []
+        if self.passage is not None:
+            parts.append(PassageView(self.passage).render())
+        return Group(
+            *parts,
+            RuleDisplay(f"{self.subject_name} Question {self.number}", self.question_text).render(),
+            hr,
+            *[f"{s[0]}. {s[1]}" for s in self.selections],
+            hr,
+        )
+
+    def printQuestion(self):
+        console.print(self.render())
 
 class CheckAnswer:
     def __init__(self, question: Question, selected: str, selections: List[tuple[str]]):
@@ -81,35 +108,40 @@ class CheckAnswer:
         self.is_correct = (selected == question.answer)
         self.selections = selections
 
-    def display(self):
-        RuleDisplay(f"Question ID {self.question.id}", self.question.text).printRule()
-        hr = Rule()
-        console.print(hr)
+    def render(self) -> RenderableType:
+        parts = [RuleDisplay(f"Question ID {self.question.id}", self.question.text).render(), Rule()]
         i = 1
         for _, c in self.selections:
             if c == self.question.answer and c == self.selected:
-                console.print(f"[bold green]{i}. {c}[/bold green]")
+                parts.append(f"[bold green]{i}. {c}[/bold green]")
             elif c == self.question.answer and c != self.selected:
-                console.print(f"[green]{i}. {c}[/green]")
+                parts.append(f"[green]{i}. {c}[/green]")
             elif c != self.question.answer and c == self.selected:
-                console.print(f"[red]{i}. {c}[/red]")
+                parts.append(f"[red]{i}. {c}[/red]")
             else:
-                console.print(f"{i}. {c}")
+                parts.append(f"{i}. {c}")
             i += 1
         if self.is_correct:
-            crule = Rule(title="CORRECT!")
-            console.print(crule)
+            parts.append(Rule(title="CORRECT!"))
         else:
-            irule = Rule(title="Incorrect")
-            console.print(irule)
+            parts.append(Rule(title="Incorrect"))
+        return Group(*parts)
+
+    def display(self):
+        console.print(self.render())
 
 class QuestionAnswer:
     def __init__(self, question: Question):
         self.question = question
 
+    def render(self) -> RenderableType:
+        return Group(
+            RuleDisplay("Question", self.question.text).render(),
+            RuleDisplay("Answer", self.question.answer).render(),
+        )
+
     def printAnswer(self):
-        RuleDisplay("Question", self.question.text).printRule()
-        RuleDisplay("Answer", self.question.answer).printRule()
+        console.print(self.render())
 
 class ProgressChart:
     def __init__(self, subject_name: str, data: List):
@@ -0,0 +1,91 @@
+import io
+import time
+from contextlib import contextmanager
+import pytest
+from rich.console import Console
+from src import views
+from src.models import Question
+from src.views import RuleDisplay, ListColumns, QuestionEntry, PassageView, DisplayQuestion, CheckAnswer, QuestionAnswer
+
+RENDER_BUDGET = 0.25
+
+def make_question():
+    question = Question("What is 2 + 2?", ["3", "5", "22"], "4")
+    question.id = 1
+    question.add_attachment("act-math-q5-figure")
+    return question
+
+def make_views():
+    question = make_question()
+    selections = question.prepare_selections()
+    return {
+        "RuleDisplay": RuleDisplay("Question", question.text),
+        "QuestionEntry": QuestionEntry(question, "act-math"),
+        "PassageView": PassageView("A long reading passage. " * 40),
+        "DisplayQuestion": DisplayQuestion("act-math", question.text, selections, 1, "A short passage."),
+        "CheckAnswer": CheckAnswer(question, "3", selections),
+        "QuestionAnswer": QuestionAnswer(question),
+        "ListColumns": ListColumns([f"{i} Question text {i}" for i in range(200)]),
+    }
+
+PRINT_METHODS = {
+    "RuleDisplay": "printRule",
+    "QuestionEntry": "printEntry",
+    "PassageView": "printPassage",
+    "DisplayQuestion": "printQuestion",
+    "CheckAnswer": "display",
+    "QuestionAnswer": "printAnswer",
+    "ListColumns": "printList",
+}
+
+@pytest.fixture
+def console(monkeypatch):
+    test_console = Console(file=io.StringIO(), width=80, height=25)
+    monkeypatch.setattr(views, "console", test_console)
+    return test_console
+
+@pytest.mark.parametrize("name", PRINT_METHODS)
+def test_render_latency(name):
+    view = make_views()[name]
+    target = Console(file=io.StringIO(), width=80)
+    start = time.perf_counter()
+    target.print(view.render())
+    elapsed = time.perf_counter() - start
+    assert target.file.getvalue()
+    assert elapsed < RENDER_BUDGET, f"{name} took {elapsed:.3f}s to render"
+
+@pytest.mark.parametrize("name", PRINT_METHODS)
+def test_print_makes_single_write(name, console, monkeypatch):
+    calls = []
+    monkeypatch.setattr(console, "print", lambda *args, **kwargs: calls.append(args))
+    view = make_views()[name]
+    getattr(view, PRINT_METHODS[name])()
+    assert len(calls) == 1
+
+def test_display_question_includes_passage(console):
+    DisplayQuestion("act-math", "Question text", [(1, "a"), (2, "b")], 1, "Passage text").printQuestion()
+    output = console.file.getvalue()
+    assert output.index("Passage text") < output.index("Question text")
+
+def paged_console(monkeypatch, height):
+    test_console = Console(file=io.StringIO(), width=80, height=height, force_terminal=True)
+    monkeypatch.setattr(views, "console", test_console)
+    paged = []
+
+    @contextmanager
+    def pager(*args, **kwargs):
+        paged.append(True)
+        yield
+
+    monkeypatch.setattr(test_console, "pager", pager)
+    return paged
+
+def test_short_listing_is_not_paged(monkeypatch):
+    paged = paged_console(monkeypatch, height=25)
+    ListColumns(["1 Short", "2 List"]).printList()
+    assert paged == []
+
+def test_tall_listing_is_paged(monkeypatch):
+    paged = paged_console(monkeypatch, height=25)
+    ListColumns([f"{i} " + "Question text " * 5 for i in range(100)]).printList()
+    assert paged == [True]